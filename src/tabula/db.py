@@ -5,7 +5,6 @@ import datetime
 import pathlib
 
 import timeflake
-from dateutil.tz import tzlocal
 from sqlalchemy import (
     Column,
     ForeignKey,
@@ -25,7 +24,7 @@ from sqlalchemy.types import Integer, String, TypeDecorator, UnicodeText
 
 from .durations import format_duration, parse_duration
 from .editor.doctypes import Paragraph, Session, Sprint
-from .util import now
+from .util import local_timezone, now
 
 
 @event.listens_for(Engine, "connect")
@@ -83,7 +82,7 @@ class AwareDateTime(TypeDecorator):
 
     def process_result_value(self, value, dialect):
         if isinstance(value, datetime.datetime):
-            value = value.replace(tzinfo=datetime.timezone.utc).astimezone(tzlocal())
+            value = value.replace(tzinfo=datetime.timezone.utc).astimezone(local_timezone())
         return value
 
     def __repr__(self):
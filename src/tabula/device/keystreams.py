@@ -39,6 +39,8 @@ class ModifierTracking(Section):
         self.lock_state = {
             KeyCode.KEY_CAPSLOCK: False,
         }
+        # ModifierAnnotation is frozen, so one instance can be shared until a modifier changes.
+        self.annotation = self._make_annotation()
 
     def _make_annotation(self):
         return ModifierAnnotation(
@@ -62,11 +64,13 @@ class ModifierTracking(Section):
                     is_led_able = True
                     if event.press is KeyPress.PRESSED:
                         self.lock_state[event.key] = not self.lock_state[event.key]
+                if is_modifier:
+                    self.annotation = self._make_annotation()
                 await sink.send(
                     AnnotatedKeyEvent(
                         key=event.key,
                         press=event.press,
-                        annotation=self._make_annotation(),
+                        annotation=self.annotation,
                         is_modifier=is_modifier,
                         is_led_able=is_led_able,
                     )
@@ -86,15 +90,16 @@ class OnlyPresses(Section):
 class MakeCharacter(Section):
     def __init__(self, keymaps: dict[KeyCode, list[str]]):
         self.keymaps = keymaps
+        # Whether a key's unshifted character is a letter (and so affected by capslock) never changes; work it out up front.
+        self.letter_keys = frozenset(key for key, keymap in keymaps.items() if unicodedata.category(keymap[0]).startswith("L"))
 
     async def pump(self, source: trio.MemoryReceiveChannel[AnnotatedKeyEvent], sink: trio.MemorySendChannel[AnnotatedKeyEvent]):
         async with aclosing(source), aclosing(sink):
             async for event in source:
-                if event.key in self.keymaps:
-                    keymap = self.keymaps[event.key]
+                keymap = self.keymaps.get(event.key)
+                if keymap is not None:
                     is_shifted = event.annotation.shift
-                    is_letter = unicodedata.category(keymap[0]).startswith("L")
-                    if is_letter:
+                    if event.key in self.letter_keys:
                         is_shifted ^= event.annotation.capslock
                     level = 1 if is_shifted else 0
                     await sink.send(msgspec.structs.replace(event, character=keymap[level]))
@@ -2,8 +2,7 @@
 
 import datetime
 import decimal
-
-from .util import maybe_int
+import re
 
 DISPLAY_UNITS = {
     "seconds": "s",
@@ -21,38 +20,46 @@ PARSE_UNITS = {
     "h": datetime.timedelta(hours=1),
 }
 
+# A run of digits and dots, optionally followed by a unit; the groups are checked separately
+# so that each malformed component gets its own error message.
+_DURATION_COMPONENT = re.compile(r"(?P<number>[0-9.]*)(?P<unit>us|ms|[smh])?")
+
+
+def _fraction(whole: int, remainder: int, digits: int) -> str:
+    if remainder == 0:
+        return str(whole)
+    return "{}.{}".format(whole, "{:0{}}".format(remainder, digits).rstrip("0"))
+
 
 def format_duration(val: datetime.timedelta) -> str:
-    if val == datetime.timedelta():
+    # smallest timedelta resolution is 1us, so work in whole microseconds throughout
+    micros = val // PARSE_UNITS["us"]
+    if micros == 0:
         return "0"
 
     parts = []
-    if val < datetime.timedelta():
+    if micros < 0:
         parts.append("-")
-        val = -val
+        micros = -micros
 
     # For durations less than 1 second, return fractions of a single unit
-    if val < PARSE_UNITS["ms"]:
-        # smallest timedelta resolution is 1us
-        parts.append(str(val.microseconds))
+    if micros < 1_000:
+        parts.append(str(micros))
         parts.append(DISPLAY_UNITS["microseconds"])
-    elif val < PARSE_UNITS["s"]:
-        milliseconds = val / PARSE_UNITS["ms"]
-        parts.append(str(maybe_int(milliseconds)))
+    elif micros < 1_000_000:
+        parts.append(_fraction(*divmod(micros, 1_000), 3))
         parts.append(DISPLAY_UNITS["milliseconds"])
     else:
-        int_hours = val // PARSE_UNITS["h"]
-        val %= PARSE_UNITS["h"]
+        int_hours, micros = divmod(micros, 3_600_000_000)
         if int_hours > 0:
             parts.append(str(int_hours))
             parts.append(DISPLAY_UNITS["hours"])
-        int_minutes = val // PARSE_UNITS["m"]
-        val %= PARSE_UNITS["m"]
+        int_minutes, micros = divmod(micros, 60_000_000)
         if int_minutes > 0:
             parts.append(str(int_minutes))
             parts.append(DISPLAY_UNITS["minutes"])
-        if val > datetime.timedelta():
-            parts.append(str(maybe_int(val.total_seconds())))
+        if micros > 0:
+            parts.append(_fraction(*divmod(micros, 1_000_000), 6))
             parts.append(DISPLAY_UNITS["seconds"])
 
     return "".join(parts)
@@ -60,21 +67,13 @@ def format_duration(val: datetime.timedelta) -> str:
 
 def timer_display(val: datetime.timedelta) -> str:
     # clamp to non-negative values and whole seconds
-    val = datetime.timedelta(seconds=int(abs(val.total_seconds())))
-    if val == datetime.timedelta():
-        return "00:00"
-    parts = []
-    int_hours = val // PARSE_UNITS["h"]
+    int_hours, seconds = divmod(abs(val) // PARSE_UNITS["s"], 3600)
     if int_hours > 9:
         raise ValueError("timer display requires single-digit hours")
-    val %= PARSE_UNITS["h"]
+    int_minutes, int_seconds = divmod(seconds, 60)
     if int_hours > 0:
-        parts.append(str(int_hours))
-    int_minutes = val // PARSE_UNITS["m"]
-    val %= PARSE_UNITS["m"]
-    parts.append("{:02}".format(int_minutes))
-    parts.append("{:02}".format(maybe_int(val.total_seconds())))
-    return ":".join(parts)
+        return "{}:{:02}:{:02}".format(int_hours, int_minutes, int_seconds)
+    return "{:02}:{:02}".format(int_minutes, int_seconds)
 
 
 def parse_duration(val: str) -> datetime.timedelta:
@@ -90,28 +89,19 @@ def parse_duration(val: str) -> datetime.timedelta:
         return datetime.timedelta()
 
     accum = datetime.timedelta()
-    while len(val) > 0:
-        # try to get a number part
-        numberpart = ""
-        while len(val) > 0 and (val[0].isdigit() or val[0] == "."):
-            numberpart += val[0]
-            val = val[1:]
+    pos = 0
+    while pos < len(val):
+        match = _DURATION_COMPONENT.match(val, pos)
+        numberpart, unitstr = match.group("number", "unit")
         if len(numberpart) == 0:
             raise ValueError("Invalid duration string; expected number")
         if not numberpart[0].isdigit():
             raise ValueError("Invalid duration string; expected leading digit")
-        number = decimal.Decimal(numberpart)
-        # try to get a unit
-        if len(val) == 0:
-            raise ValueError("Invalid duration string; expected unit")
-        unit = None
-        for unitstr in PARSE_UNITS:
-            if val.startswith(unitstr):
-                unit = PARSE_UNITS[unitstr]
-                val = val[len(unitstr) :]
-                break
-        if unit is None:
+        if unitstr is None:
             raise ValueError("Invalid duration string; expected unit")
+        number = decimal.Decimal(numberpart)
+        unit = PARSE_UNITS[unitstr]
+        pos = match.end()
 
         intpart = number // 1
         fracpart = number % 1
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import collections.abc
 import dataclasses
 import logging
 import re
@@ -8,8 +9,6 @@ import typing
 from ..device.eventsource import KeyCode
 
 if typing.TYPE_CHECKING:
-    import pygtrie
-
     from ..device.hwtypes import AnnotatedKeyEvent
 
 logger = logging.getLogger(__name__)
@@ -38,12 +37,42 @@ CODEPOINT_MATCHER = re.compile(r"^\+((?:[0-9A-Fa-f]){4})$")
 PAD_FORMATTER = "{:0<5}".format
 
 
+class ComposeSequences(collections.abc.Mapping[tuple[str, ...], str]):
+    """Compose sequences keyed by tuples of characters.
+
+    Every prefix of every sequence is precomputed, so checking whether a partial sequence can still match is a single set lookup.
+    """
+
+    def __init__(self, sequences: collections.abc.Mapping[tuple[str, ...], str]):
+        self._sequences = dict(sequences)
+        self._prefixes = frozenset(seq[:i] for seq in self._sequences for i in range(1, len(seq) + 1))
+
+    def __getitem__(self, key: tuple[str, ...]):
+        return self._sequences[key]
+
+    def __contains__(self, key: object):
+        return key in self._sequences
+
+    def __iter__(self):
+        return iter(self._sequences)
+
+    def __len__(self):
+        return len(self._sequences)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._sequences!r})"
+
+    def has_prefix(self, key: tuple[str, ...]):
+        "Returns True if key is a complete sequence or the beginning of one."
+        return key in self._prefixes
+
+
 class ComposeState:
     active: bool
     devoured: list[AnnotatedKeyEvent]
     devoured_characters: list[str]
 
-    def __init__(self, sequences: pygtrie.Trie):
+    def __init__(self, sequences: ComposeSequences):
         self.sequences = sequences
         self.active = False
 
@@ -75,17 +104,17 @@ class ComposeState:
         still_matching = False
         if event.character is not None:
             self.devoured_characters.append(event.character)
-            self.can_be_compose_sequence = bool(self.sequences.has_node(self.devoured_characters))
+            self.can_be_compose_sequence = self.sequences.has_prefix(tuple(self.devoured_characters))
             self.can_be_codepoint = bool(CODEPOINT_MATCHER.match(PAD_FORMATTER("".join(self.devoured_characters))))
             still_matching = self.can_be_compose_sequence or self.can_be_codepoint
         if not (still_matching or event.is_modifier):
             # not a match
             self.active = False
             return ComposeFailed(key_events=self.devoured)
-        if self.sequences.has_key(self.devoured_characters):
+        if (result := self.sequences.get(tuple(self.devoured_characters))) is not None:
             # end of sequence
             self.active = False
-            return ComposeSucceeded(result=self.sequences[self.devoured_characters])
+            return ComposeSucceeded(result=result)
         if codepoint_match := CODEPOINT_MATCHER.match("".join(self.devoured_characters)):
             self.active = False
             codepoint_str = codepoint_match.group(1)
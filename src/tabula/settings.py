@@ -1,16 +1,17 @@
 import dataclasses
 import datetime
-import json
 import operator
+import os
 import pathlib
 import typing
 
 import cattrs
-import pygtrie
+import msgspec
 
 from .commontypes import ScreenRotation
 from .device.eventsource import KeyCode
 from .durations import format_duration, parse_duration
+from .editor.composes import ComposeSequences
 
 COMPOSE_SEQUENCES = {
     "< <": "«",
@@ -148,22 +149,36 @@ def timedelta_seconds(seconds: datetime.timedelta | int | str):
 
 
 settings_converter = cattrs.Converter()
+settings_encoder = msgspec.json.Encoder()
+settings_decoder = msgspec.json.Decoder()
 settings_converter.register_unstructure_hook(datetime.timedelta, format_duration)
 settings_converter.register_structure_hook(datetime.timedelta, lambda d, _: parse_duration(d))
 
 
-def unstructure_trie(t: pygtrie.Trie):
-    return {" ".join(k): v for k, v in t.items()}
+def unstructure_compose_sequences(cs: ComposeSequences):
+    return {" ".join(k): v for k, v in cs.items()}
 
 
-def structure_trie(d: dict, typ: type[pygtrie.Trie]):
-    return pygtrie.Trie({tuple(k.split()): v for k, v in d.items()})
+def _split_compose_sequences(d: dict[str, str]):
+    return ComposeSequences({tuple(k.split()): v for k, v in d.items()})
 
 
-settings_converter.register_unstructure_hook(pygtrie.Trie, unstructure_trie)
-settings_converter.register_structure_hook(pygtrie.Trie, structure_trie)
+# ComposeSequences is read-only, so every Settings using the stock sequences can share one prebuilt copy.
+DEFAULT_COMPOSE_SEQUENCES = _split_compose_sequences(COMPOSE_SEQUENCES)
+
+
+def structure_compose_sequences(d: dict, typ: type[ComposeSequences]):
+    if d == COMPOSE_SEQUENCES:
+        return DEFAULT_COMPOSE_SEQUENCES
+    return _split_compose_sequences(d)
+
+
+settings_converter.register_unstructure_hook(ComposeSequences, unstructure_compose_sequences)
+settings_converter.register_structure_hook(ComposeSequences, structure_compose_sequences)
 settings_converter.register_unstructure_hook(KeyCode, operator.attrgetter("name"))
-settings_converter.register_structure_hook(KeyCode, lambda v, _: KeyCode[v])
+# KeyCode[name] goes through EnumType.__getitem__; the keymaps need dozens of lookups, so use the member map directly.
+_KEYCODES_BY_NAME = KeyCode.__members__
+settings_converter.register_structure_hook(KeyCode, lambda v, _: _KEYCODES_BY_NAME[v])
 
 
 def unstructure_screen_rotation(sr: ScreenRotation):
@@ -193,7 +208,7 @@ class Settings:
     current_line_spacing: float
     compose_key: KeyCode
     compose_key_description: str
-    compose_sequences: pygtrie.Trie
+    compose_sequences: ComposeSequences
     compose_examples: list[dict[str, str]]
     keymaps: dict[KeyCode, list[str]]
     db_path: pathlib.Path
@@ -214,11 +229,19 @@ class Settings:
             dest = self._path
         raw = settings_converter.unstructure(self)
         del raw["_path"]
-        json.dump(raw, dest.open("w"), indent=2)
+        # json.dump falls back to its pure-Python encoder whenever indent is given; msgspec encodes and pretty-prints in C.
+        encoded = msgspec.json.format(settings_encoder.encode(raw), indent=2)
+        # Write to a sibling file and swap it into place, so losing power mid-save can't leave a truncated settings file.
+        temp_dest = dest.with_name(dest.name + ".tmp")
+        with temp_dest.open("wb") as f:
+            f.write(encoded)
+            f.flush()
+            os.fsync(f.fileno())
+        temp_dest.replace(dest)
 
     @classmethod
     def load(cls, src: pathlib.Path):
-        raw = json.load(src.open())
+        raw = settings_decoder.decode(src.read_bytes())
         raw["_path"] = src
         return settings_converter.structure(raw, cls)
 
@@ -233,6 +256,7 @@ class Settings:
                 "compose_key": COMPOSE_KEY,
                 "compose_key_description": COMPOSE_KEY_DESCRIPTION,
                 "compose_sequences": COMPOSE_SEQUENCES,
+                "compose_examples": [],
                 "keymaps": KEYMAPS,
                 "db_path": "test.db",
                 "export_path": "test_export",
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
+import bisect
 import collections.abc
 import datetime
 import enum
+import functools
 import inspect
 import math
+import os.path
 import typing
 
 import outcome
 import trio
-from dateutil.tz import tzlocal
 
 if typing.TYPE_CHECKING:
     from _cffi_backend import FFI as FFIType
@@ -22,22 +24,6 @@ TABULA: trio.lowlevel.RunVar["Tabula"] = trio.lowlevel.RunVar("tabula_app_instan
 AwaitableCallback = collections.abc.Callable[[], collections.abc.Awaitable[None]]
 
 
-def _nameprefix(*names: str):
-    "Given multiple identifiers (such as those used for enums), return the longest common prefix, or the empty string if no such prefix is found."
-    if not names:
-        return ""
-    names = sorted(set(names))
-    if len(names) == 1:
-        return names[0]
-    first = names[0]
-    last = names[-1]
-    for i, ch in enumerate(first):
-        if ch != last[i]:  # first differing character
-            return first[:i]  # so return everything up to that point
-    # if we fall off the end of the for loop, then the first string is a substring of the last string, which seems weird but is possible.
-    return first
-
-
 def check_c_enum(ffi: FFIType, enum_t: str, strip_prefix: str | None = None, allow_omitting_c_members: bool = False, **extras: int):
     """Checks an IntEnum for consistency with a C enum.
 
@@ -67,7 +53,7 @@ def check_c_enum(ffi: FFIType, enum_t: str, strip_prefix: str | None = None, all
     """
     ctype = ffi.typeof(enum_t)
     if strip_prefix is None:
-        strip_prefix = _nameprefix(*ctype.relements.keys())
+        strip_prefix = os.path.commonprefix(tuple(ctype.relements.keys()))
     values: dict[str, int] = {k.removeprefix(strip_prefix): v for v, k in sorted(ctype.elements.items())}
     values.update(extras)
 
@@ -87,9 +73,7 @@ def check_c_enum(ffi: FFIType, enum_t: str, strip_prefix: str | None = None, all
 
 
 async def invoke_if_present(obj: typing.Any, method_name: str, **provided_kwargs):
-    if not hasattr(obj, method_name):
-        return None
-    c = getattr(obj, method_name)
+    c = getattr(obj, method_name, None)
     if not callable(c):
         return None
     result = invoke(c, **provided_kwargs)
@@ -98,15 +82,25 @@ async def invoke_if_present(obj: typing.Any, method_name: str, **provided_kwargs
     return result
 
 
+@functools.lru_cache(maxsize=256)
+def _parameter_names(c: typing.Callable) -> frozenset[str]:
+    return frozenset(inspect.signature(c).parameters)
+
+
 def invoke(c: typing.Callable, **provided_kwargs):
-    sig = inspect.signature(c)
-    used_kwargs = {k: v for k, v in provided_kwargs.items() if k in sig.parameters}
+    if not provided_kwargs:
+        # nothing to filter, so no need to look at the signature at all
+        return c()
+    # Bound methods are created anew on every attribute lookup, so cache against the underlying function instead.
+    # Its parameters also include self/cls, but nobody passes those as keyword arguments.
+    parameter_names = _parameter_names(getattr(c, "__func__", c))
+    used_kwargs = {k: v for k, v in provided_kwargs.items() if k in parameter_names}
     return c(**used_kwargs)
 
 
 def set_into[V](list: list[typing.Optional[V]], index: int, item: V):
-    while index >= len(list):
-        list.append(None)
+    if (gap := index + 1 - len(list)) > 0:
+        list.extend([None] * gap)
     list[index] = item
 
 
@@ -114,79 +108,68 @@ def maybe_int(val: float):
     return int(val) if val.is_integer() else val
 
 
+@functools.cache
+def local_timezone():
+    # dateutil is only needed once something asks for local time; scripts that just load settings shouldn't pay for the import.
+    from dateutil.tz import tzlocal
+
+    return tzlocal()
+
+
 def now():
-    return datetime.datetime.now(tzlocal())
+    return datetime.datetime.now(local_timezone())
 
 
 def removing[V](tup: tuple[V], item: V):
-    temp = list(tup)
-    temp.remove(item)
-    return tuple(temp)
+    index = tup.index(item)
+    return tup[:index] + tup[index + 1 :]
 
 
 def replacing_last[V](tup: tuple[V], item: V):
-    temp = list(tup)
-    temp[-1] = item
-    return tuple(temp)
+    if not tup:
+        raise IndexError("tuple index out of range")
+    return (*tup[:-1], item)
+
+
+# Exclusive upper bounds (in seconds) for each humanized phrase, in ascending order.
+_DELTA_BOUNDS = (
+    (60, "less than a minute"),
+    (5 * 60, "a few minutes"),
+    (8 * 60, "about five minutes"),
+    (13 * 60, "about ten minutes"),
+    (19 * 60, "about fifteen minutes"),
+    (23 * 60, "about twenty minutes"),
+    (29 * 60, "about twenty-five minutes"),
+    (39 * 60, "about half an hour"),
+    (49 * 60, "about forty-five minutes"),
+    (60 * 60, "almost an hour"),
+    (76 * 60, "about an hour"),
+    (106 * 60, "about ninety minutes"),
+    (151 * 60, "about two hours"),
+    (211 * 60, "about three hours"),
+    (271 * 60, "about four hours"),
+    (331 * 60, "about five hours"),
+    (391 * 60, "about six hours"),
+    (24 * 60 * 60, "several hours"),
+    (2 * 24 * 60 * 60, "a day"),
+    (3 * 24 * 60 * 60, "two days"),
+    (5 * 24 * 60 * 60, "a few days"),
+    (9 * 24 * 60 * 60, "several days"),
+)
+_DELTA_KEYS = tuple(bound for bound, _ in _DELTA_BOUNDS)
+_DELTA_PHRASES = (*(phrase for _, phrase in _DELTA_BOUNDS), "a good long while")
 
 
 def humanized_delta(delta: datetime.timedelta, allow_future: bool = False):
-    seconds = int(delta.total_seconds())
+    # timedelta stores whole days plus non-negative seconds and microseconds; integer math skips the float round-trip
+    seconds = delta.days * 86400 + delta.seconds
+    if seconds < 0 and delta.microseconds:
+        # truncate toward zero, as int() would
+        seconds += 1
     if seconds == 0:
         return "now"
     relative_template = "in {}" if allow_future and seconds > 0 else "{} ago"
-
-    seconds = abs(seconds)
-
-    if seconds < 60:
-        return relative_template.format("less than a minute")
-    minutes = seconds // 60
-    if minutes <= 4:
-        return relative_template.format("a few minutes")
-    if minutes <= 7:
-        return relative_template.format("about five minutes")
-    if minutes <= 12:
-        return relative_template.format("about ten minutes")
-    if minutes <= 18:
-        return relative_template.format("about fifteen minutes")
-    if minutes <= 22:
-        return relative_template.format("about twenty minutes")
-    if minutes <= 28:
-        return relative_template.format("about twenty-five minutes")
-    if minutes <= 38:
-        return relative_template.format("about half an hour")
-    if minutes <= 48:
-        return relative_template.format("about forty-five minutes")
-    hours = minutes // 60
-    hour_change = minutes % 60
-    if hours == 0:
-        return relative_template.format("almost an hour")
-    if hours == 1 and hour_change <= 15:
-        return relative_template.format("about an hour")
-    if hours == 1 and hour_change <= 45:
-        return relative_template.format("about ninety minutes")
-    if hours == 1 or (hours == 2 and hour_change <= 30):
-        return relative_template.format("about two hours")
-    if hours == 2 or (hours == 3 and hour_change <= 30):
-        return relative_template.format("about three hours")
-    if hours == 3 or (hours == 4 and hour_change <= 30):
-        return relative_template.format("about four hours")
-    if hours == 4 or (hours == 5 and hour_change <= 30):
-        return relative_template.format("about five hours")
-    if hours == 5 or (hours == 6 and hour_change <= 30):
-        return relative_template.format("about six hours")
-    days = hours // 24
-    if days == 0:
-        return relative_template.format("several hours")
-    if days == 1:
-        return relative_template.format("a day")
-    if days == 2:
-        return relative_template.format("two days")
-    if days < 5:
-        return relative_template.format("a few days")
-    if days < 9:
-        return relative_template.format("several days")
-    return relative_template.format("a good long while")
+    return relative_template.format(_DELTA_PHRASES[bisect.bisect_right(_DELTA_KEYS, abs(seconds))])
 
 
 class AlreadyFinalizedError(Exception):
@@ -194,6 +177,7 @@ class AlreadyFinalizedError(Exception):
 
 
 class Future[V]:
+    __slots__ = ("_event", "_outcome")
     _outcome: typing.Optional[outcome.Outcome]
 
     def __init__(self):
@@ -222,12 +206,21 @@ GOLDEN_RATIO = (math.sqrt(5) + 1) / 2
 
 
 def golden_section_search(eval_func: collections.abc.Callable[[float], float], lower_bound: float, upper_bound: float, tolerance=1e-5):
+    candidate_from_upper = upper_bound - (upper_bound - lower_bound) / GOLDEN_RATIO
+    candidate_from_lower = lower_bound + (upper_bound - lower_bound) / GOLDEN_RATIO
+    value_from_upper = eval_func(candidate_from_upper)
+    value_from_lower = eval_func(candidate_from_lower)
+    # Each step keeps one of the two candidates as a candidate for the narrowed interval, so only one new evaluation is needed.
     while abs(upper_bound - lower_bound) > tolerance:
-        candidate_from_upper = upper_bound - (upper_bound - lower_bound) / GOLDEN_RATIO
-        candidate_from_lower = lower_bound + (upper_bound - lower_bound) / GOLDEN_RATIO
-        if eval_func(candidate_from_upper) < eval_func(candidate_from_lower):  # f(c) > f(d) to find the maximum
+        if value_from_upper < value_from_lower:  # f(c) > f(d) to find the maximum
             upper_bound = candidate_from_lower
+            candidate_from_lower, value_from_lower = candidate_from_upper, value_from_upper
+            candidate_from_upper = upper_bound - (upper_bound - lower_bound) / GOLDEN_RATIO
+            value_from_upper = eval_func(candidate_from_upper)
         else:
             lower_bound = candidate_from_upper
+            candidate_from_upper, value_from_upper = candidate_from_lower, value_from_lower
+            candidate_from_lower = lower_bound + (upper_bound - lower_bound) / GOLDEN_RATIO
+            value_from_lower = eval_func(candidate_from_lower)
 
     return (upper_bound + lower_bound) / 2
@@ -0,0 +1,55 @@
+from tabula.device.eventsource import KeyCode
+from tabula.device.hwtypes import AnnotatedKeyEvent, KeyPress, ModifierAnnotation
+from tabula.editor.composes import ComposeFailed, ComposeOther, ComposeSequences, ComposeState, ComposeSucceeded
+
+SEQUENCES = ComposeSequences({("<", "<"): "«", ("-", "-", "-"): "—", ("-", "-", "."): "–"})
+
+
+def make_event(key: KeyCode, character: str | None = None):
+    return AnnotatedKeyEvent(key=key, press=KeyPress.PRESSED, annotation=ModifierAnnotation(), character=character)
+
+
+COMPOSE = AnnotatedKeyEvent(
+    key=KeyCode.KEY_COMPOSE,
+    press=KeyPress.PRESSED,
+    annotation=ModifierAnnotation(compose=True),
+    is_modifier=True,
+    is_led_able=True,
+)
+
+
+def test_compose_sequences_prefixes():
+    assert SEQUENCES.has_prefix(("-",))
+    assert SEQUENCES.has_prefix(("-", "-"))
+    assert SEQUENCES.has_prefix(("-", "-", "-"))
+    assert not SEQUENCES.has_prefix(("-", "<"))
+    assert ("-", "-", "-") in SEQUENCES
+    assert ("-", "-") not in SEQUENCES
+
+
+def test_compose_state_sequence():
+    state = ComposeState(SEQUENCES)
+    assert state.handle_key_event(COMPOSE) == ComposeOther(active_changed=True)
+    assert state.handle_key_event(make_event(KeyCode.KEY_MINUS, "-")) == ComposeOther()
+    assert state.handle_key_event(make_event(KeyCode.KEY_MINUS, "-")) == ComposeOther()
+    assert state.composing_chars == "--"
+    assert state.handle_key_event(make_event(KeyCode.KEY_DOT, ".")) == ComposeSucceeded(result="–")
+    assert not state.active
+
+
+def test_compose_state_failure():
+    state = ComposeState(SEQUENCES)
+    state.handle_key_event(COMPOSE)
+    first = make_event(KeyCode.KEY_COMMA, "<")
+    second = make_event(KeyCode.KEY_X, "x")
+    assert state.handle_key_event(first) == ComposeOther()
+    assert state.handle_key_event(second) == ComposeFailed(key_events=[first, second])
+    assert not state.active
+
+
+def test_compose_state_codepoint():
+    state = ComposeState(SEQUENCES)
+    state.handle_key_event(COMPOSE)
+    for character, key in (("+", KeyCode.KEY_EQUAL), ("0", KeyCode.KEY_0), ("0", KeyCode.KEY_0), ("E", KeyCode.KEY_E)):
+        assert state.handle_key_event(make_event(key, character)) == ComposeOther()
+    assert state.handle_key_event(make_event(KeyCode.KEY_9, "9")) == ComposeSucceeded(result="é")
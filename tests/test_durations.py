@@ -21,6 +21,7 @@ from tabula.durations import format_duration, parse_duration, timer_display
         (timedelta(minutes=1, milliseconds=250), "1m0.25s"),
         (timedelta(hours=1, minutes=1, milliseconds=250), "1h1m0.25s"),
         (timedelta(hours=1, microseconds=500), "1h0.0005s"),
+        (timedelta(hours=1, microseconds=1), "1h0.000001s"),
         (timedelta(milliseconds=1, microseconds=200), "1.2ms"),
         (timedelta(microseconds=-1), "-1us"),
         (timedelta(milliseconds=-1), "-1ms"),
@@ -1,725 +1,244 @@
 import collections.abc
 import datetime
-import typing
 from contextlib import aclosing
 
+import pytest
+from trio.lowlevel import checkpoint
+
 from tabula.commontypes import Point
 from tabula.device.gestures import MakePersistent, TapRecognizer, make_tapstream, pump_all
 from tabula.device.hwtypes import PersistentTouchReport, TapEvent, TapPhase, TouchEvent, TouchReport
-from trio.lowlevel import checkpoint
 
-T = typing.TypeVar("T")
 
-
-async def make_async_source(
+async def make_async_source[T](
     items: collections.abc.Sequence[T],
 ):
+    # Checkpoint before every item so each report is fully handled downstream before the next
+    # one arrives: MakePersistent mutates its PersistentTouch objects in place, so letting it
+    # run ahead would change touches that TapRecognizer has not looked at yet.
     for item in items:
         await checkpoint()
         yield item
 
 
-SIMPLE_TAP = (
-    TouchReport(
-        touches=[TouchEvent(x=408, y=1021, pressure=35, slot=0)],
-        timestamp=datetime.timedelta(seconds=7205, microseconds=138932),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=408, y=1021, pressure=35, slot=0)],
-        timestamp=datetime.timedelta(seconds=7205, microseconds=149671),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=408, y=1021, pressure=35, slot=0)],
-        timestamp=datetime.timedelta(seconds=7205, microseconds=160708),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=409, y=1021, pressure=35, slot=0)],
-        timestamp=datetime.timedelta(seconds=7205, microseconds=175591),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=409, y=1021, pressure=33, slot=0)],
-        timestamp=datetime.timedelta(seconds=7205, microseconds=191628),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=409, y=1021, pressure=32, slot=0)],
-        timestamp=datetime.timedelta(seconds=7205, microseconds=207221),
-    ),
-    TouchReport(touches=[], timestamp=datetime.timedelta(seconds=7205, microseconds=209221)),
-)
+def single_touch_reports(
+    rows: collections.abc.Iterable[tuple[int, int, int, int, int]],
+    released_at: tuple[int, int],
+) -> tuple[TouchReport, ...]:
+    """Build slot-0 reports from (x, y, pressure, seconds, microseconds) rows, then an empty report for the lift."""
+    reports = [
+        TouchReport(
+            touches=[TouchEvent(x=x, y=y, pressure=pressure, slot=0)],
+            timestamp=datetime.timedelta(seconds=seconds, microseconds=microseconds),
+        )
+        for x, y, pressure, seconds, microseconds in rows
+    ]
+    seconds, microseconds = released_at
+    reports.append(TouchReport(touches=[], timestamp=datetime.timedelta(seconds=seconds, microseconds=microseconds)))
+    return tuple(reports)
 
 
-async def test_tap_recognition_pipeline():
-    async with (
-        aclosing(make_async_source(SIMPLE_TAP)) as touchsource,
-        pump_all(touchsource, MakePersistent(), TapRecognizer()) as resultsource,
-    ):
-        actual = [event async for event in resultsource]
-        expected = [
-            TapEvent(location=Point(x=408, y=1021), phase=TapPhase.INITIATED),
-            TapEvent(location=Point(x=409, y=1021), phase=TapPhase.COMPLETED),
-        ]
-        assert actual == expected
+def touch_reports(
+    rows: collections.abc.Iterable[tuple[int, int, *tuple[tuple[int, int, int, int], ...]]],
+) -> tuple[TouchReport, ...]:
+    """Build reports from (seconds, microseconds, *touches) rows, where each touch is (x, y, pressure, slot)."""
+    return tuple(
+        TouchReport(
+            touches=[TouchEvent(x=x, y=y, pressure=pressure, slot=slot) for x, y, pressure, slot in touches],
+            timestamp=datetime.timedelta(seconds=seconds, microseconds=microseconds),
+        )
+        for seconds, microseconds, *touches in rows
+    )
 
 
-async def test_tap_recognition_tapstream():
-    async with aclosing(make_async_source(SIMPLE_TAP)) as touchsource, make_tapstream(touchsource) as tapstream:
-        actual = [event async for event in tapstream]
-        expected = [
-            TapEvent(location=Point(x=408, y=1021), phase=TapPhase.INITIATED),
-            TapEvent(location=Point(x=409, y=1021), phase=TapPhase.COMPLETED),
-        ]
-        assert actual == expected
-
-
-TOO_LIGHT = (
-    TouchReport(
-        touches=[TouchEvent(x=773, y=944, pressure=21, slot=0)],
-        timestamp=datetime.timedelta(seconds=13966, microseconds=125988),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=773, y=944, pressure=22, slot=0)],
-        timestamp=datetime.timedelta(seconds=13966, microseconds=136891),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=772, y=944, pressure=23, slot=0)],
-        timestamp=datetime.timedelta(seconds=13966, microseconds=147354),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=772, y=944, pressure=24, slot=0)],
-        timestamp=datetime.timedelta(seconds=13966, microseconds=163191),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=771, y=944, pressure=25, slot=0)],
-        timestamp=datetime.timedelta(seconds=13966, microseconds=178754),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=771, y=944, pressure=24, slot=0)],
-        timestamp=datetime.timedelta(seconds=13966, microseconds=194660),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=771, y=944, pressure=25, slot=0)],
-        timestamp=datetime.timedelta(seconds=13966, microseconds=210599),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=771, y=944, pressure=24, slot=0)],
-        timestamp=datetime.timedelta(seconds=13966, microseconds=226484),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=771, y=944, pressure=24, slot=0)],
-        timestamp=datetime.timedelta(seconds=13966, microseconds=242367),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=771, y=944, pressure=23, slot=0)],
-        timestamp=datetime.timedelta(seconds=13966, microseconds=258412),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=771, y=943, pressure=21, slot=0)],
-        timestamp=datetime.timedelta(seconds=13966, microseconds=273984),
-    ),
-    TouchReport(touches=[], timestamp=datetime.timedelta(seconds=13966, microseconds=293984)),
+SIMPLE_TAP = single_touch_reports(
+    (
+        (408, 1021, 35, 7205, 138932),
+        (408, 1021, 35, 7205, 149671),
+        (408, 1021, 35, 7205, 160708),
+        (409, 1021, 35, 7205, 175591),
+        (409, 1021, 33, 7205, 191628),
+        (409, 1021, 32, 7205, 207221),
+    ),
+    released_at=(7205, 209221),
 )
+SIMPLE_TAP_EXPECTED = [
+    TapEvent(location=Point(x=408, y=1021), phase=TapPhase.INITIATED),
+    TapEvent(location=Point(x=409, y=1021), phase=TapPhase.COMPLETED),
+]
 
 
-async def test_tap_recognition_pipeline_too_light():
-    async with (
-        aclosing(make_async_source(TOO_LIGHT)) as touchsource,
-        pump_all(touchsource, MakePersistent(), TapRecognizer()) as resultsource,
-    ):
-        actual = [event async for event in resultsource]
-        assert len(actual) == 0
+TOO_LIGHT = single_touch_reports(
+    (
+        (773, 944, 21, 13966, 125988),
+        (773, 944, 22, 13966, 136891),
+        (772, 944, 23, 13966, 147354),
+        (772, 944, 24, 13966, 163191),
+        (771, 944, 25, 13966, 178754),
+        (771, 944, 24, 13966, 194660),
+        (771, 944, 25, 13966, 210599),
+        (771, 944, 24, 13966, 226484),
+        (771, 944, 24, 13966, 242367),
+        (771, 944, 23, 13966, 258412),
+        (771, 943, 21, 13966, 273984),
+    ),
+    released_at=(13966, 293984),
+)
 
 
-SWIPE = (
-    TouchReport(
-        touches=[TouchEvent(x=764, y=753, pressure=32, slot=0)],
-        timestamp=datetime.timedelta(seconds=15456, microseconds=476973),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=763, y=753, pressure=32, slot=0)],
-        timestamp=datetime.timedelta(seconds=15456, microseconds=487943),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=760, y=758, pressure=32, slot=0)],
-        timestamp=datetime.timedelta(seconds=15456, microseconds=498494),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=756, y=767, pressure=33, slot=0)],
-        timestamp=datetime.timedelta(seconds=15456, microseconds=514423),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=749, y=784, pressure=34, slot=0)],
-        timestamp=datetime.timedelta(seconds=15456, microseconds=529480),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=739, y=811, pressure=35, slot=0)],
-        timestamp=datetime.timedelta(seconds=15456, microseconds=545398),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=725, y=868, pressure=35, slot=0)],
-        timestamp=datetime.timedelta(seconds=15456, microseconds=561307),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=714, y=925, pressure=36, slot=0)],
-        timestamp=datetime.timedelta(seconds=15456, microseconds=577113),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=706, y=967, pressure=36, slot=0)],
-        timestamp=datetime.timedelta(seconds=15456, microseconds=592972),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=701, y=1002, pressure=36, slot=0)],
-        timestamp=datetime.timedelta(seconds=15456, microseconds=608841),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=697, y=1028, pressure=37, slot=0)],
-        timestamp=datetime.timedelta(seconds=15456, microseconds=624860),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=695, y=1047, pressure=37, slot=0)],
-        timestamp=datetime.timedelta(seconds=15456, microseconds=640618),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=692, y=1062, pressure=37, slot=0)],
-        timestamp=datetime.timedelta(seconds=15456, microseconds=656259),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=691, y=1075, pressure=37, slot=0)],
-        timestamp=datetime.timedelta(seconds=15456, microseconds=672344),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=690, y=1084, pressure=37, slot=0)],
-        timestamp=datetime.timedelta(seconds=15456, microseconds=687861),
-    ),
-    TouchReport(touches=[], timestamp=datetime.timedelta(seconds=15456, microseconds=697861)),
+SWIPE = single_touch_reports(
+    (
+        (764, 753, 32, 15456, 476973),
+        (763, 753, 32, 15456, 487943),
+        (760, 758, 32, 15456, 498494),
+        (756, 767, 33, 15456, 514423),
+        (749, 784, 34, 15456, 529480),
+        (739, 811, 35, 15456, 545398),
+        (725, 868, 35, 15456, 561307),
+        (714, 925, 36, 15456, 577113),
+        (706, 967, 36, 15456, 592972),
+        (701, 1002, 36, 15456, 608841),
+        (697, 1028, 37, 15456, 624860),
+        (695, 1047, 37, 15456, 640618),
+        (692, 1062, 37, 15456, 656259),
+        (691, 1075, 37, 15456, 672344),
+        (690, 1084, 37, 15456, 687861),
+    ),
+    released_at=(15456, 697861),
 )
 
 
-async def test_tap_recognition_pipeline_moves_too_much():
+@pytest.mark.parametrize(
+    "reports,expected",
+    (
+        (SIMPLE_TAP, SIMPLE_TAP_EXPECTED),
+        (TOO_LIGHT, []),
+        (
+            SWIPE,
+            [
+                TapEvent(location=Point(x=764, y=753), phase=TapPhase.INITIATED),
+                TapEvent(location=Point(x=749, y=784), phase=TapPhase.CANCELED),
+            ],
+        ),
+    ),
+    ids=("tap", "too_light", "moves_too_much"),
+)
+async def test_tap_recognition_pipeline(reports: tuple[TouchReport, ...], expected: list[TapEvent]):
     async with (
-        aclosing(make_async_source(SWIPE)) as touchsource,
+        aclosing(make_async_source(reports)) as touchsource,
         pump_all(touchsource, MakePersistent(), TapRecognizer()) as resultsource,
     ):
         actual = [event async for event in resultsource]
-        expected = [
-            TapEvent(location=Point(x=764, y=753), phase=TapPhase.INITIATED),
-            TapEvent(location=Point(x=749, y=784), phase=TapPhase.CANCELED),
-        ]
         assert actual == expected
 
 
-MULTI_TOUCH_REPORTS = (
-    TouchReport(
-        touches=[TouchEvent(x=763, y=1030, pressure=29, slot=0)],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=339761),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=763, y=1030, pressure=29, slot=0)],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=350722),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=763, y=1031, pressure=29, slot=0)],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=361484),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=763, y=1031, pressure=30, slot=0)],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=377180),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=763, y=1032, pressure=32, slot=0)],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=392253),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=765, y=1033, pressure=34, slot=0)],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=408202),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=766, y=1034, pressure=35, slot=0)],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=424050),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=766, y=1036, pressure=37, slot=0)],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=439904),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=767, y=1037, pressure=38, slot=0)],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=455712),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=768, y=1038, pressure=39, slot=0)],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=471671),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=768, y=1038, pressure=40, slot=0)],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=487422),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=768, y=1039, pressure=41, slot=0)],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=503289),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=768, y=1041, pressure=41, slot=0)],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=519314),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=767, y=1042, pressure=41, slot=0),
-            TouchEvent(x=288, y=1027, pressure=42, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=536629),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=766, y=1044, pressure=41, slot=0),
-            TouchEvent(x=288, y=1027, pressure=42, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=552478),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=766, y=1045, pressure=41, slot=0),
-            TouchEvent(x=289, y=1027, pressure=42, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=568316),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=766, y=1045, pressure=41, slot=0),
-            TouchEvent(x=291, y=1027, pressure=42, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=584134),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=766, y=1045, pressure=41, slot=0),
-            TouchEvent(x=294, y=1026, pressure=40, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=600082),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=765, y=1042, pressure=41, slot=0),
-            TouchEvent(x=295, y=1024, pressure=39, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=615893),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=764, y=1040, pressure=41, slot=0),
-            TouchEvent(x=297, y=1022, pressure=39, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=631814),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=762, y=1037, pressure=41, slot=0),
-            TouchEvent(x=300, y=1021, pressure=39, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=647491),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=760, y=1035, pressure=41, slot=0),
-            TouchEvent(x=302, y=1019, pressure=39, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=663381),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=757, y=1034, pressure=41, slot=0),
-            TouchEvent(x=312, y=1017, pressure=39, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=679346),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=755, y=1034, pressure=41, slot=0),
-            TouchEvent(x=326, y=1014, pressure=39, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=695105),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=755, y=1034, pressure=41, slot=0),
-            TouchEvent(x=345, y=1011, pressure=39, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=711192),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=754, y=1035, pressure=41, slot=0),
-            TouchEvent(x=363, y=1008, pressure=37, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=726877),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=753, y=1038, pressure=41, slot=0),
-            TouchEvent(x=382, y=1005, pressure=36, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=742719),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=753, y=1040, pressure=41, slot=0),
-            TouchEvent(x=400, y=1002, pressure=36, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=758461),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=753, y=1042, pressure=41, slot=0),
-            TouchEvent(x=417, y=1000, pressure=36, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=774405),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=752, y=1043, pressure=41, slot=0),
-            TouchEvent(x=432, y=998, pressure=36, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=790240),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=752, y=1045, pressure=41, slot=0),
-            TouchEvent(x=447, y=996, pressure=36, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=806226),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=752, y=1046, pressure=41, slot=0),
-            TouchEvent(x=465, y=994, pressure=36, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=821986),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=752, y=1047, pressure=41, slot=0),
-            TouchEvent(x=479, y=992, pressure=36, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=837802),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=753, y=1048, pressure=41, slot=0),
-            TouchEvent(x=490, y=991, pressure=36, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=853722),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=753, y=1048, pressure=41, slot=0),
-            TouchEvent(x=498, y=990, pressure=36, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=869481),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=754, y=1048, pressure=41, slot=0),
-            TouchEvent(x=504, y=989, pressure=36, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=885250),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=754, y=1048, pressure=41, slot=0),
-            TouchEvent(x=509, y=989, pressure=36, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=901214),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=756, y=1048, pressure=42, slot=0),
-            TouchEvent(x=512, y=989, pressure=36, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=917170),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=757, y=1048, pressure=43, slot=0),
-            TouchEvent(x=515, y=989, pressure=36, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=932967),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=758, y=1048, pressure=43, slot=0),
-            TouchEvent(x=517, y=989, pressure=36, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=948794),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=759, y=1049, pressure=43, slot=0),
-            TouchEvent(x=519, y=989, pressure=36, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=964682),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=759, y=1049, pressure=43, slot=0),
-            TouchEvent(x=520, y=989, pressure=36, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=980480),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=759, y=1049, pressure=43, slot=0),
-            TouchEvent(x=520, y=989, pressure=36, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7407, microseconds=996406),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=759, y=1045, pressure=43, slot=0),
-            TouchEvent(x=520, y=989, pressure=36, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=12212),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=760, y=1045, pressure=43, slot=0),
-            TouchEvent(x=521, y=989, pressure=36, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=28024),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=760, y=1046, pressure=43, slot=0),
-            TouchEvent(x=521, y=989, pressure=36, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=43960),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=760, y=1047, pressure=43, slot=0),
-            TouchEvent(x=522, y=989, pressure=36, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=59827),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=760, y=1048, pressure=43, slot=0),
-            TouchEvent(x=522, y=989, pressure=36, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=75667),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=761, y=1048, pressure=43, slot=0),
-            TouchEvent(x=522, y=989, pressure=36, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=91590),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=761, y=1049, pressure=43, slot=0),
-            TouchEvent(x=523, y=989, pressure=36, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=107392),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=761, y=1049, pressure=43, slot=0),
-            TouchEvent(x=523, y=989, pressure=36, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=123236),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=760, y=1044, pressure=43, slot=0),
-            TouchEvent(x=523, y=989, pressure=37, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=139027),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=758, y=1039, pressure=39, slot=0),
-            TouchEvent(x=523, y=990, pressure=38, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=154752),
-    ),
-    TouchReport(
-        touches=[
-            TouchEvent(x=756, y=1035, pressure=37, slot=0),
-            TouchEvent(x=521, y=991, pressure=39, slot=1),
-        ],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=170400),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=519, y=992, pressure=39, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=186223),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=517, y=992, pressure=39, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=200838),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=515, y=993, pressure=39, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=216738),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=514, y=993, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=232561),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=513, y=993, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=248374),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=513, y=993, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=264230),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=511, y=994, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=280243),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=510, y=995, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=295925),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=509, y=995, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=311787),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=508, y=995, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=327670),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=508, y=995, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=343505),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=508, y=995, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=359415),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=508, y=995, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=375264),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=508, y=995, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=391081),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=508, y=995, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=406997),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=507, y=995, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=422825),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=507, y=995, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=438578),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=507, y=995, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=454476),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=507, y=995, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=470278),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=507, y=995, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=486177),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=507, y=995, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=502047),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=507, y=995, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=517834),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=507, y=995, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=533778),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=507, y=995, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=549568),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=507, y=995, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=565392),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=507, y=995, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=581310),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=507, y=995, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=597128),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=507, y=995, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=612966),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=507, y=995, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=628777),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=507, y=995, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=644622),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=506, y=995, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=660482),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=505, y=994, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=676307),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=505, y=994, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=692218),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=504, y=993, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=708030),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=504, y=993, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=723906),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=503, y=993, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=739710),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=503, y=993, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=755356),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=503, y=992, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=771422),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=503, y=992, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=787330),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=503, y=992, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=803092),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=503, y=992, pressure=40, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=818882),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=503, y=992, pressure=38, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=834754),
-    ),
-    TouchReport(
-        touches=[TouchEvent(x=503, y=992, pressure=37, slot=1)],
-        timestamp=datetime.timedelta(seconds=7408, microseconds=850116),
-    ),
-    TouchReport(touches=[], timestamp=datetime.timedelta(seconds=7408, microseconds=859116)),
+async def test_tap_recognition_tapstream():
+    async with aclosing(make_async_source(SIMPLE_TAP)) as touchsource, make_tapstream(touchsource) as tapstream:
+        actual = [event async for event in tapstream]
+        assert actual == SIMPLE_TAP_EXPECTED
+
+
+MULTI_TOUCH_REPORTS = touch_reports(
+    (
+        (7407, 339761, (763, 1030, 29, 0)),
+        (7407, 350722, (763, 1030, 29, 0)),
+        (7407, 361484, (763, 1031, 29, 0)),
+        (7407, 377180, (763, 1031, 30, 0)),
+        (7407, 392253, (763, 1032, 32, 0)),
+        (7407, 408202, (765, 1033, 34, 0)),
+        (7407, 424050, (766, 1034, 35, 0)),
+        (7407, 439904, (766, 1036, 37, 0)),
+        (7407, 455712, (767, 1037, 38, 0)),
+        (7407, 471671, (768, 1038, 39, 0)),
+        (7407, 487422, (768, 1038, 40, 0)),
+        (7407, 503289, (768, 1039, 41, 0)),
+        (7407, 519314, (768, 1041, 41, 0)),
+        (7407, 536629, (767, 1042, 41, 0), (288, 1027, 42, 1)),
+        (7407, 552478, (766, 1044, 41, 0), (288, 1027, 42, 1)),
+        (7407, 568316, (766, 1045, 41, 0), (289, 1027, 42, 1)),
+        (7407, 584134, (766, 1045, 41, 0), (291, 1027, 42, 1)),
+        (7407, 600082, (766, 1045, 41, 0), (294, 1026, 40, 1)),
+        (7407, 615893, (765, 1042, 41, 0), (295, 1024, 39, 1)),
+        (7407, 631814, (764, 1040, 41, 0), (297, 1022, 39, 1)),
+        (7407, 647491, (762, 1037, 41, 0), (300, 1021, 39, 1)),
+        (7407, 663381, (760, 1035, 41, 0), (302, 1019, 39, 1)),
+        (7407, 679346, (757, 1034, 41, 0), (312, 1017, 39, 1)),
+        (7407, 695105, (755, 1034, 41, 0), (326, 1014, 39, 1)),
+        (7407, 711192, (755, 1034, 41, 0), (345, 1011, 39, 1)),
+        (7407, 726877, (754, 1035, 41, 0), (363, 1008, 37, 1)),
+        (7407, 742719, (753, 1038, 41, 0), (382, 1005, 36, 1)),
+        (7407, 758461, (753, 1040, 41, 0), (400, 1002, 36, 1)),
+        (7407, 774405, (753, 1042, 41, 0), (417, 1000, 36, 1)),
+        (7407, 790240, (752, 1043, 41, 0), (432, 998, 36, 1)),
+        (7407, 806226, (752, 1045, 41, 0), (447, 996, 36, 1)),
+        (7407, 821986, (752, 1046, 41, 0), (465, 994, 36, 1)),
+        (7407, 837802, (752, 1047, 41, 0), (479, 992, 36, 1)),
+        (7407, 853722, (753, 1048, 41, 0), (490, 991, 36, 1)),
+        (7407, 869481, (753, 1048, 41, 0), (498, 990, 36, 1)),
+        (7407, 885250, (754, 1048, 41, 0), (504, 989, 36, 1)),
+        (7407, 901214, (754, 1048, 41, 0), (509, 989, 36, 1)),
+        (7407, 917170, (756, 1048, 42, 0), (512, 989, 36, 1)),
+        (7407, 932967, (757, 1048, 43, 0), (515, 989, 36, 1)),
+        (7407, 948794, (758, 1048, 43, 0), (517, 989, 36, 1)),
+        (7407, 964682, (759, 1049, 43, 0), (519, 989, 36, 1)),
+        (7407, 980480, (759, 1049, 43, 0), (520, 989, 36, 1)),
+        (7407, 996406, (759, 1049, 43, 0), (520, 989, 36, 1)),
+        (7408, 12212, (759, 1045, 43, 0), (520, 989, 36, 1)),
+        (7408, 28024, (760, 1045, 43, 0), (521, 989, 36, 1)),
+        (7408, 43960, (760, 1046, 43, 0), (521, 989, 36, 1)),
+        (7408, 59827, (760, 1047, 43, 0), (522, 989, 36, 1)),
+        (7408, 75667, (760, 1048, 43, 0), (522, 989, 36, 1)),
+        (7408, 91590, (761, 1048, 43, 0), (522, 989, 36, 1)),
+        (7408, 107392, (761, 1049, 43, 0), (523, 989, 36, 1)),
+        (7408, 123236, (761, 1049, 43, 0), (523, 989, 36, 1)),
+        (7408, 139027, (760, 1044, 43, 0), (523, 989, 37, 1)),
+        (7408, 154752, (758, 1039, 39, 0), (523, 990, 38, 1)),
+        (7408, 170400, (756, 1035, 37, 0), (521, 991, 39, 1)),
+        (7408, 186223, (519, 992, 39, 1)),
+        (7408, 200838, (517, 992, 39, 1)),
+        (7408, 216738, (515, 993, 39, 1)),
+        (7408, 232561, (514, 993, 40, 1)),
+        (7408, 248374, (513, 993, 40, 1)),
+        (7408, 264230, (513, 993, 40, 1)),
+        (7408, 280243, (511, 994, 40, 1)),
+        (7408, 295925, (510, 995, 40, 1)),
+        (7408, 311787, (509, 995, 40, 1)),
+        (7408, 327670, (508, 995, 40, 1)),
+        (7408, 343505, (508, 995, 40, 1)),
+        (7408, 359415, (508, 995, 40, 1)),
+        (7408, 375264, (508, 995, 40, 1)),
+        (7408, 391081, (508, 995, 40, 1)),
+        (7408, 406997, (508, 995, 40, 1)),
+        (7408, 422825, (507, 995, 40, 1)),
+        (7408, 438578, (507, 995, 40, 1)),
+        (7408, 454476, (507, 995, 40, 1)),
+        (7408, 470278, (507, 995, 40, 1)),
+        (7408, 486177, (507, 995, 40, 1)),
+        (7408, 502047, (507, 995, 40, 1)),
+        (7408, 517834, (507, 995, 40, 1)),
+        (7408, 533778, (507, 995, 40, 1)),
+        (7408, 549568, (507, 995, 40, 1)),
+        (7408, 565392, (507, 995, 40, 1)),
+        (7408, 581310, (507, 995, 40, 1)),
+        (7408, 597128, (507, 995, 40, 1)),
+        (7408, 612966, (507, 995, 40, 1)),
+        (7408, 628777, (507, 995, 40, 1)),
+        (7408, 644622, (507, 995, 40, 1)),
+        (7408, 660482, (506, 995, 40, 1)),
+        (7408, 676307, (505, 994, 40, 1)),
+        (7408, 692218, (505, 994, 40, 1)),
+        (7408, 708030, (504, 993, 40, 1)),
+        (7408, 723906, (504, 993, 40, 1)),
+        (7408, 739710, (503, 993, 40, 1)),
+        (7408, 755356, (503, 993, 40, 1)),
+        (7408, 771422, (503, 992, 40, 1)),
+        (7408, 787330, (503, 992, 40, 1)),
+        (7408, 803092, (503, 992, 40, 1)),
+        (7408, 818882, (503, 992, 40, 1)),
+        (7408, 834754, (503, 992, 38, 1)),
+        (7408, 850116, (503, 992, 37, 1)),
+        (7408, 859116),
+    )
 )
 
 
@@ -730,7 +249,8 @@ async def test_make_persistent_multitouch():
     ):
         begun = set()
         ended = set()
-        seen = set()
+        # each touch_id should be reported with the same PersistentTouch object throughout
+        identities = {}
         report: PersistentTouchReport
         async for report in resultsource:
             # first id 1 will begin
@@ -753,7 +273,6 @@ async def test_make_persistent_multitouch():
                 assert begun == set([1, 2])
                 assert ended == set([1])
             ended.update(ended_ids)
-            seen.update([id(t) for t in report.began])
-            seen.update([id(t) for t in report.moved])
-            seen.update([id(t) for t in report.ended])
-        assert len(seen) == 2
+            for pt in (*report.began, *report.moved, *report.ended):
+                assert identities.setdefault(pt.touch_id, pt) is pt
+        assert len(identities) == 2
@@ -2,60 +2,68 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 import collections.abc
-import typing
 from contextlib import aclosing
 
-import pygtrie
 import pytest
 import trio
 from tabula.device.eventsource import KeyCode
 from tabula.device.hwtypes import AnnotatedKeyEvent, KeyEvent, KeyPress, ModifierAnnotation
 from tabula.device.keystreams import ComposeKey, MakeCharacter, ModifierTracking, OnlyPresses, make_keystream, pump_all
+from tabula.editor.composes import ComposeSequences
 from tabula.settings import Settings
-from trio.lowlevel import checkpoint
+from trio.lowlevel import cancel_shielded_checkpoint
 
-T = typing.TypeVar("T")
 
-
-async def make_async_source(
+async def make_async_source[T](
     items: collections.abc.Sequence[T],
+    *,
+    batch: int = 8,
 ):
-    for item in items:
-        await checkpoint()
+    # Every event emitted downstream is a frozen struct, so the sections can safely run a few items behind
+    # the source; yield to the scheduler once per batch rather than before every key event.
+    for i, item in enumerate(items):
+        if i % batch == 0:
+            await cancel_shielded_checkpoint()
         yield item
 
 
+# Types "Hello WORLD", using shift for the H and capslock for WORLD; capslock is left on.
+HELLO_WORLD_KEY_EVENTS = (
+    KeyEvent(key=KeyCode.KEY_LEFTSHIFT, press=KeyPress.PRESSED),
+    KeyEvent(key=KeyCode.KEY_H, press=KeyPress.PRESSED),
+    KeyEvent(key=KeyCode.KEY_H, press=KeyPress.RELEASED),
+    KeyEvent(key=KeyCode.KEY_LEFTSHIFT, press=KeyPress.RELEASED),
+    KeyEvent(key=KeyCode.KEY_E, press=KeyPress.PRESSED),
+    KeyEvent(key=KeyCode.KEY_E, press=KeyPress.RELEASED),
+    KeyEvent(key=KeyCode.KEY_L, press=KeyPress.PRESSED),
+    KeyEvent(key=KeyCode.KEY_L, press=KeyPress.RELEASED),
+    KeyEvent(key=KeyCode.KEY_L, press=KeyPress.PRESSED),
+    KeyEvent(key=KeyCode.KEY_L, press=KeyPress.RELEASED),
+    KeyEvent(key=KeyCode.KEY_O, press=KeyPress.PRESSED),
+    KeyEvent(key=KeyCode.KEY_O, press=KeyPress.RELEASED),
+    KeyEvent(key=KeyCode.KEY_SPACE, press=KeyPress.PRESSED),
+    KeyEvent(key=KeyCode.KEY_SPACE, press=KeyPress.RELEASED),
+    KeyEvent(key=KeyCode.KEY_CAPSLOCK, press=KeyPress.PRESSED),
+    KeyEvent(key=KeyCode.KEY_CAPSLOCK, press=KeyPress.RELEASED),
+    KeyEvent(key=KeyCode.KEY_W, press=KeyPress.PRESSED),
+    KeyEvent(key=KeyCode.KEY_W, press=KeyPress.RELEASED),
+    KeyEvent(key=KeyCode.KEY_O, press=KeyPress.PRESSED),
+    KeyEvent(key=KeyCode.KEY_O, press=KeyPress.RELEASED),
+    KeyEvent(key=KeyCode.KEY_R, press=KeyPress.PRESSED),
+    KeyEvent(key=KeyCode.KEY_R, press=KeyPress.RELEASED),
+    KeyEvent(key=KeyCode.KEY_L, press=KeyPress.PRESSED),
+    KeyEvent(key=KeyCode.KEY_L, press=KeyPress.RELEASED),
+    KeyEvent(key=KeyCode.KEY_D, press=KeyPress.PRESSED),
+    KeyEvent(key=KeyCode.KEY_D, press=KeyPress.RELEASED),
+)
+
+
 async def test_modifier_tracking_basics():
     async with (
         aclosing(
             make_async_source(
                 [
-                    KeyEvent(key=KeyCode.KEY_LEFTSHIFT, press=KeyPress.PRESSED),
-                    KeyEvent(key=KeyCode.KEY_H, press=KeyPress.PRESSED),
-                    KeyEvent(key=KeyCode.KEY_H, press=KeyPress.RELEASED),
-                    KeyEvent(key=KeyCode.KEY_LEFTSHIFT, press=KeyPress.RELEASED),
-                    KeyEvent(key=KeyCode.KEY_E, press=KeyPress.PRESSED),
-                    KeyEvent(key=KeyCode.KEY_E, press=KeyPress.RELEASED),
-                    KeyEvent(key=KeyCode.KEY_L, press=KeyPress.PRESSED),
-                    KeyEvent(key=KeyCode.KEY_L, press=KeyPress.RELEASED),
-                    KeyEvent(key=KeyCode.KEY_L, press=KeyPress.PRESSED),
-                    KeyEvent(key=KeyCode.KEY_L, press=KeyPress.RELEASED),
-                    KeyEvent(key=KeyCode.KEY_O, press=KeyPress.PRESSED),
-                    KeyEvent(key=KeyCode.KEY_O, press=KeyPress.RELEASED),
-                    KeyEvent(key=KeyCode.KEY_SPACE, press=KeyPress.PRESSED),
-                    KeyEvent(key=KeyCode.KEY_SPACE, press=KeyPress.RELEASED),
-                    KeyEvent(key=KeyCode.KEY_CAPSLOCK, press=KeyPress.PRESSED),
-                    KeyEvent(key=KeyCode.KEY_CAPSLOCK, press=KeyPress.RELEASED),
-                    KeyEvent(key=KeyCode.KEY_W, press=KeyPress.PRESSED),
-                    KeyEvent(key=KeyCode.KEY_W, press=KeyPress.RELEASED),
-                    KeyEvent(key=KeyCode.KEY_O, press=KeyPress.PRESSED),
-                    KeyEvent(key=KeyCode.KEY_O, press=KeyPress.RELEASED),
-                    KeyEvent(key=KeyCode.KEY_R, press=KeyPress.PRESSED),
-                    KeyEvent(key=KeyCode.KEY_R, press=KeyPress.RELEASED),
-                    KeyEvent(key=KeyCode.KEY_L, press=KeyPress.PRESSED),
-                    KeyEvent(key=KeyCode.KEY_L, press=KeyPress.RELEASED),
-                    KeyEvent(key=KeyCode.KEY_D, press=KeyPress.PRESSED),
-                    KeyEvent(key=KeyCode.KEY_D, press=KeyPress.RELEASED),
+                    *HELLO_WORLD_KEY_EVENTS,
                     KeyEvent(key=KeyCode.KEY_CAPSLOCK, press=KeyPress.PRESSED),
                     KeyEvent(key=KeyCode.KEY_CAPSLOCK, press=KeyPress.RELEASED),
                 ]
@@ -213,32 +221,7 @@ async def test_make_characters():
         aclosing(
             make_async_source(
                 [
-                    KeyEvent(key=KeyCode.KEY_LEFTSHIFT, press=KeyPress.PRESSED),
-                    KeyEvent(key=KeyCode.KEY_H, press=KeyPress.PRESSED),
-                    KeyEvent(key=KeyCode.KEY_H, press=KeyPress.RELEASED),
-                    KeyEvent(key=KeyCode.KEY_LEFTSHIFT, press=KeyPress.RELEASED),
-                    KeyEvent(key=KeyCode.KEY_E, press=KeyPress.PRESSED),
-                    KeyEvent(key=KeyCode.KEY_E, press=KeyPress.RELEASED),
-                    KeyEvent(key=KeyCode.KEY_L, press=KeyPress.PRESSED),
-                    KeyEvent(key=KeyCode.KEY_L, press=KeyPress.RELEASED),
-                    KeyEvent(key=KeyCode.KEY_L, press=KeyPress.PRESSED),
-                    KeyEvent(key=KeyCode.KEY_L, press=KeyPress.RELEASED),
-                    KeyEvent(key=KeyCode.KEY_O, press=KeyPress.PRESSED),
-                    KeyEvent(key=KeyCode.KEY_O, press=KeyPress.RELEASED),
-                    KeyEvent(key=KeyCode.KEY_SPACE, press=KeyPress.PRESSED),
-                    KeyEvent(key=KeyCode.KEY_SPACE, press=KeyPress.RELEASED),
-                    KeyEvent(key=KeyCode.KEY_CAPSLOCK, press=KeyPress.PRESSED),
-                    KeyEvent(key=KeyCode.KEY_CAPSLOCK, press=KeyPress.RELEASED),
-                    KeyEvent(key=KeyCode.KEY_W, press=KeyPress.PRESSED),
-                    KeyEvent(key=KeyCode.KEY_W, press=KeyPress.RELEASED),
-                    KeyEvent(key=KeyCode.KEY_O, press=KeyPress.PRESSED),
-                    KeyEvent(key=KeyCode.KEY_O, press=KeyPress.RELEASED),
-                    KeyEvent(key=KeyCode.KEY_R, press=KeyPress.PRESSED),
-                    KeyEvent(key=KeyCode.KEY_R, press=KeyPress.RELEASED),
-                    KeyEvent(key=KeyCode.KEY_L, press=KeyPress.PRESSED),
-                    KeyEvent(key=KeyCode.KEY_L, press=KeyPress.RELEASED),
-                    KeyEvent(key=KeyCode.KEY_D, press=KeyPress.PRESSED),
-                    KeyEvent(key=KeyCode.KEY_D, press=KeyPress.RELEASED),
+                    *HELLO_WORLD_KEY_EVENTS,
                     # Numbers and punctuation should not be affected by capslock
                     KeyEvent(key=KeyCode.KEY_1, press=KeyPress.PRESSED),
                     KeyEvent(key=KeyCode.KEY_1, press=KeyPress.RELEASED),
@@ -679,7 +662,7 @@ async def test_composes():
         "A E": "Æ",
         "a e": "æ",
     }
-    composes = pygtrie.Trie({tuple(k.split()): v for k, v in raw_composes.items()})
+    composes = ComposeSequences({tuple(k.split()): v for k, v in raw_composes.items()})
     keymaps = {
         KeyCode.KEY_A: ["a", "A"],
         KeyCode.KEY_E: ["e", "E"],
@@ -820,7 +803,7 @@ async def test_composes_sequence_failure():
         "A E": "Æ",
         "a e": "æ",
     }
-    composes = pygtrie.Trie({tuple(k.split()): v for k, v in raw_composes.items()})
+    composes = ComposeSequences({tuple(k.split()): v for k, v in raw_composes.items()})
     keymaps = {
         KeyCode.KEY_A: ["a", "A"],
         KeyCode.KEY_E: ["e", "E"],
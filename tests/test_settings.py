@@ -0,0 +1,39 @@
+import pathlib
+
+import msgspec
+
+from tabula.settings import DEFAULT_COMPOSE_SEQUENCES, Settings
+
+
+def test_settings_roundtrip(tmp_path: pathlib.Path):
+    settings_path = tmp_path / "settings.json"
+    settings = Settings.for_test()
+    settings.save(settings_path)
+    loaded = Settings.load(settings_path)
+    assert loaded._path == settings_path
+    loaded._path = settings._path
+    assert loaded == settings
+
+
+def test_settings_save_replaces_existing(tmp_path: pathlib.Path):
+    settings_path = tmp_path / "settings.json"
+    settings_path.write_text("stale")
+    Settings.for_test().save(settings_path)
+    assert Settings.load(settings_path).current_font == "Tabula Quattro"
+    assert [p.name for p in tmp_path.iterdir()] == ["settings.json"]
+
+
+def test_settings_durations_use_go_format(tmp_path: pathlib.Path):
+    # settings files are edited by hand, so durations stay in the same format as format_duration/parse_duration
+    settings_path = tmp_path / "settings.json"
+    Settings.for_test().save(settings_path)
+    raw = msgspec.json.decode(settings_path.read_bytes())
+    assert raw["max_editable_age"] == "1h"
+    assert raw["sprint_lengths"] == ["5m", "10m", "15m", "30m"]
+
+
+def test_settings_share_default_compose_sequences(tmp_path: pathlib.Path):
+    settings_path = tmp_path / "settings.json"
+    Settings.for_test().save(settings_path)
+    assert Settings.load(settings_path).compose_sequences is DEFAULT_COMPOSE_SEQUENCES
+    assert Settings.for_test().compose_sequences[("<", "<")] == "«"
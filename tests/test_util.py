@@ -0,0 +1,124 @@
+from datetime import timedelta
+
+import pytest
+
+from tabula.util import (
+    AlreadyFinalizedError,
+    Future,
+    golden_section_search,
+    humanized_delta,
+    invoke_if_present,
+    removing,
+    replacing_last,
+    set_into,
+)
+
+
+@pytest.mark.parametrize(
+    "delta,expected",
+    (
+        (timedelta(), "now"),
+        (timedelta(milliseconds=500), "now"),
+        (-timedelta(milliseconds=500), "now"),
+        (-timedelta(seconds=1, milliseconds=500), "less than a minute ago"),
+        (timedelta(seconds=59), "less than a minute ago"),
+        (timedelta(minutes=1), "a few minutes ago"),
+        (timedelta(minutes=4, seconds=59), "a few minutes ago"),
+        (timedelta(minutes=5), "about five minutes ago"),
+        (timedelta(minutes=12, seconds=59), "about ten minutes ago"),
+        (timedelta(minutes=38), "about half an hour ago"),
+        (timedelta(minutes=48, seconds=59), "about forty-five minutes ago"),
+        (timedelta(minutes=59, seconds=59), "almost an hour ago"),
+        (timedelta(hours=1, minutes=15), "about an hour ago"),
+        (timedelta(hours=1, minutes=16), "about ninety minutes ago"),
+        (timedelta(hours=1, minutes=46), "about two hours ago"),
+        (timedelta(hours=2, minutes=30), "about two hours ago"),
+        (timedelta(hours=2, minutes=31), "about three hours ago"),
+        (timedelta(hours=6, minutes=30, seconds=59), "about six hours ago"),
+        (timedelta(hours=6, minutes=31), "several hours ago"),
+        (timedelta(days=1), "a day ago"),
+        (timedelta(days=2), "two days ago"),
+        (timedelta(days=4, hours=23), "a few days ago"),
+        (timedelta(days=8), "several days ago"),
+        (timedelta(days=9), "a good long while ago"),
+        (-timedelta(minutes=5), "about five minutes ago"),
+    ),
+)
+def test_humanized_delta(delta: timedelta, expected: str):
+    assert humanized_delta(delta) == expected
+
+
+@pytest.mark.parametrize(
+    "delta,expected",
+    (
+        (timedelta(minutes=5), "in about five minutes"),
+        (-timedelta(minutes=5), "about five minutes ago"),
+        (timedelta(days=3), "in a few days"),
+    ),
+)
+def test_humanized_delta_future(delta: timedelta, expected: str):
+    assert humanized_delta(delta, allow_future=True) == expected
+
+
+def test_golden_section_search():
+    calls = []
+
+    def eval_func(x: float):
+        calls.append(x)
+        return abs(x - 12.3)
+
+    found = golden_section_search(eval_func, 1, 100)
+    assert round(found, 1) == 12.3
+    # one evaluation per narrowing step, plus the two initial candidates
+    assert len(calls) < 40
+
+
+def test_removing():
+    assert removing((1, 2, 3, 2), 2) == (1, 3, 2)
+    assert removing((1,), 1) == ()
+    with pytest.raises(ValueError):
+        removing((1, 2), 3)
+
+
+def test_replacing_last():
+    assert replacing_last((1, 2, 3), 4) == (1, 2, 4)
+    assert replacing_last((1,), 4) == (4,)
+    with pytest.raises(IndexError):
+        replacing_last((), 4)
+
+
+async def test_future():
+    future = Future()
+    assert not future.is_final
+    future.finalize(5)
+    assert future.is_final
+    assert await future.wait() == 5
+    with pytest.raises(AlreadyFinalizedError):
+        future.finalize(6)
+    assert not hasattr(future, "__dict__")
+
+
+def test_set_into():
+    items = [1]
+    set_into(items, 3, 4)
+    assert items == [1, None, None, 4]
+    set_into(items, 1, 2)
+    assert items == [1, 2, None, 4]
+
+
+async def test_invoke_if_present():
+    class Responder:
+        not_callable = 5
+
+        def sync_method(self):
+            return "sync"
+
+        async def async_method(self, *, event):
+            return event
+
+    responder = Responder()
+    assert await invoke_if_present(responder, "missing") is None
+    assert await invoke_if_present(responder, "not_callable") is None
+    assert await invoke_if_present(responder, "sync_method") == "sync"
+    assert await invoke_if_present(responder, "sync_method", event=1) == "sync"
+    assert await invoke_if_present(responder, "async_method", event=2, other=3) == 2